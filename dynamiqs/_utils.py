@@ -4,7 +4,9 @@ from typing import Any
 
 import equinox as eqx
 import jax.numpy as jnp
+import numpy as np
 from jaxtyping import Array, ArrayLike, PyTree
+from qutip import Qobj
 
 
 def type_str(type: Any) -> str:  # noqa: A002
@@ -40,6 +42,17 @@ def cdtype() -> jnp.complex64 | jnp.complex128:
         raise ValueError(f'Data type `{dtype.dtype}` is not yet supported.')
 
 
+def asjaxarray(x: ArrayLike, dtype: jnp.dtype | None = None) -> Array:
+    # Convert an array-like object to a JAX array. A list of NumPy arrays or QuTiP
+    # objects is first stacked on the host, such that a single array is created on the
+    # device (`jnp.asarray` converts each element to a JAX array before stacking them).
+    if isinstance(x, (list, tuple)) and all(
+        isinstance(y, (np.ndarray, Qobj)) for y in x
+    ):
+        x = np.stack([np.asarray(y) for y in x]) if len(x) > 0 else np.array([])
+    return jnp.asarray(x, dtype=dtype)
+
+
 def tree_str_inline(x: PyTree) -> str:
     # return an inline formatting of a pytree as a string
     return eqx.tree_pformat(x, indent=0).replace('\n', '').replace(',', ', ')
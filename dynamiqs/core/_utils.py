@@ -8,7 +8,7 @@ import jax.tree_util as jtu
 from jax._src.lib import xla_client
 from jaxtyping import ArrayLike, PyTree
 
-from .._utils import cdtype, obj_type_str
+from .._utils import asjaxarray, cdtype, obj_type_str
 from ..solver import Solver, _ODEAdaptiveStep
 from ..time_array import ConstantTimeArray, Shape, TimeArray
 from .abstract_solver import AbstractSolver
@@ -20,7 +20,7 @@ def _astimearray(x: ArrayLike | TimeArray) -> TimeArray:
     else:
         try:
             # same as dq.constant() but not checking the shape
-            array = jnp.asarray(x, dtype=cdtype())
+            array = asjaxarray(x, dtype=cdtype())
             return ConstantTimeArray(array)
         except (TypeError, ValueError) as e:
             raise TypeError(
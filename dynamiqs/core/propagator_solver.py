@@ -8,6 +8,7 @@ import jax.numpy as jnp
 from jax import Array
 from jaxtyping import PyTree, Scalar
 
+from .._utils import _get_default_dtype
 from ..time_array import ConstantTimeArray
 from .abstract_solver import BaseSolver, MESolver, SESolver
 
@@ -39,10 +40,34 @@ class PropagatorSolver(BaseSolver):
         self.H = self.H.array
 
     def run(self) -> PyTree:
+        # === precompute the propagator for equally spaced save times
+        # When the save times are on a uniform grid (e.g. `jnp.linspace`), every step
+        # uses the same propagator, which is computed once instead of at each step.
+        # The grid is compared to the save times up to their representation error,
+        # such that states are still saved at the requested times.
+        ts = self.ts.astype(_get_default_dtype())
+        dt = (ts[-1] - ts[0]) / max(len(ts) - 1, 1)
+        grid = ts[0] + dt * jnp.arange(len(ts))
+        atol = 4 * jnp.finfo(ts.dtype).eps * jnp.abs(ts).max()
+        uniform = (dt > 0) & jnp.allclose(ts, grid, rtol=0, atol=atol)
+        grid_propagator = self.propagator(dt)
+
+        # the first step from `t0` to `ts[0]` is never a grid step
+        on_grid = uniform & (jnp.arange(len(ts)) > 0)
+
         # === solve differential equation
-        def propagate(y, delta_t):  # noqa: ANN001, ANN202
+        def forward(delta_t, on_grid, y):  # noqa: ANN001, ANN202
+            propagator = jax.lax.cond(
+                on_grid, lambda: grid_propagator, lambda: self.propagator(delta_t)
+            )
+            return propagator @ y
+
+        def propagate(y, x):  # noqa: ANN001, ANN202
+            delta_t, on_grid = x
             # propagate forward except if delta_t is zero
-            y = jax.lax.cond(delta_t == 0, lambda: y, lambda: self.forward(delta_t, y))
+            y = jax.lax.cond(
+                delta_t == 0, lambda: y, lambda: forward(delta_t, on_grid, y)
+            )
             # save result
             res = self.save(y)
             return y, res
@@ -51,7 +76,7 @@ class PropagatorSolver(BaseSolver):
         # https://github.com/google/jax/pull/19381 (fixed in jax-0.4.24)
         # the `.reshape(-1)` covers the case where `self.t0` is a 0-dimensional array
         delta_ts = jnp.diff(self.ts, prepend=jnp.asarray(self.t0).reshape(-1))
-        ylast, saved = jax.lax.scan(propagate, self.y0, delta_ts)
+        ylast, saved = jax.lax.scan(propagate, self.y0, (delta_ts, on_grid))
 
         # === collect and return results
         nsteps = (delta_ts != 0).sum()
@@ -59,7 +84,7 @@ class PropagatorSolver(BaseSolver):
         return self.result(saved, infos=self.Infos(nsteps))
 
     @abstractmethod
-    def forward(self, delta_t: Scalar, y: Array) -> Array:
+    def propagator(self, delta_t: Scalar) -> Array:
         pass
 
 
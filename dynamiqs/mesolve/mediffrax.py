@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import diffrax as dx
 import jax.numpy as jnp
+from jax import Array
 
 from ..core.abstract_solver import MESolver
 from ..core.diffrax_solver import (
@@ -11,9 +12,23 @@ from ..core.diffrax_solver import (
     EulerSolver,
     Tsit5Solver,
 )
+from ..time_array import ConstantTimeArray
 from ..utils.utils import dag
 
 
+def _sum_LdL(Ls: Array) -> Array:
+    # compute sum_k Lk^† @ Lk in a single contraction, without materializing the
+    # adjoint of the jump operators or the intermediate products
+    return jnp.einsum('kji,kjl->il', Ls.conj(), Ls)  # (n, n)
+
+
+def _kraus_map(Ls: Array, y: Array) -> Array:
+    # compute sum_k Lk @ y @ Lk^†, the sum over k is contracted within the second
+    # product to avoid materializing the k terms `Lk @ y @ Lk^†` before reducing them
+    Lsy = jnp.einsum('kij,jl->kil', Ls, y)  # (k, n, n)
+    return jnp.einsum('kil,kml->im', Lsy, Ls.conj())  # (n, n)
+
+
 class MEDiffraxSolver(DiffraxSolver, MESolver):
     @property
     def terms(self) -> dx.AbstractTerm:
@@ -34,13 +49,35 @@ class MEDiffraxSolver(DiffraxSolver, MESolver):
         #    precision), while rho_a is strictly constant.
         # In practice, we still use (2) because it involves less matrix multiplications,
         # and is thus more efficient numerically with only a negligible numerical error
-        # induced on the dynamics.
+        # induced on the dynamics. It exploits the hermiticity of rho: the products
+        # `H @ rho` and `rho @ H` of (1) are the adjoint of one another, so (2)
+        # computes a single one and recovers the other half of the right-hand side by
+        # hermitian conjugation, which halves the number of matrix multiplications
+        # (XLA has no hermitian matrix product primitive that could do better).
+
+        # The scalar factors of (2) are folded into the operators, such that
+        # (2) = (G @ rho + sum_k Mk @ rho @ Mk^†) + h.c. with Mk = Lk / sqrt(2) and
+        # G = -i H - sum_k Mk^† @ Mk = -i (H - 0.5i sum_k Lk^† @ Lk), and no scalar
+        # multiplication of a matrix is left to do at every step.
+
+        if all(isinstance(L, ConstantTimeArray) for L in self.Ls):
+            # for time-independent jump operators, the stacked operators and G are
+            # computed once, if H is also time-independent then G is a constant
+            # time-array and no work is left to do on it at every step
+            Ls = jnp.stack([L.array for L in self.Ls])
+
+            Ms = Ls / jnp.sqrt(2)
+            G = -1j * self.H - _sum_LdL(Ms)
+            operators = lambda t: (Ms, G(t))
+        else:
+
+            def operators(t):  # noqa: ANN001, ANN202
+                Ms = jnp.stack([L(t) for L in self.Ls]) / jnp.sqrt(2)
+                return Ms, -1j * self.H(t) - _sum_LdL(Ms)
 
         def vector_field(t, y, _):  # noqa: ANN001, ANN202
-            Ls = jnp.stack([L(t) for L in self.Ls])
-            Lsd = dag(Ls)
-            LdL = (Lsd @ Ls).sum(0)
-            tmp = (-1j * self.H(t) - 0.5 * LdL) @ y + 0.5 * (Ls @ y @ Lsd).sum(0)
+            Ms, G = operators(t)
+            tmp = G @ y + _kraus_map(Ms, y)
             return tmp + dag(tmp)
 
         return dx.ODETerm(vector_field)
@@ -17,9 +17,8 @@ class MEPropagator(MEPropagatorSolver):
         self.lindbladian = slindbladian(self.H, self.Ls)  # (n^2, n^2)
         self.y0 = operator_to_vector(self.y0)  # (n^2, 1)
 
-    def forward(self, delta_t: Scalar, y: Array) -> Array:
-        propagator = jax.scipy.linalg.expm(delta_t * self.lindbladian)
-        return propagator @ y
+    def propagator(self, delta_t: Scalar) -> Array:
+        return jax.scipy.linalg.expm(delta_t * self.lindbladian)
 
     def save(self, y: Array) -> Saved:
         # TODO: implement bexpect for vectorized operators and convert at the end
@@ -10,13 +10,20 @@ from ..core.diffrax_solver import (
     EulerSolver,
     Tsit5Solver,
 )
+from ..time_array import ConstantTimeArray
 
 
 class SEDiffraxSolver(DiffraxSolver, SESolver):
     @property
     def terms(self) -> dx.AbstractTerm:
         # define Schrödinger term d|psi>/dt = - i H |psi>
-        vector_field = lambda t, y, _: -1j * self.H(t) @ y
+        if isinstance(self.H, ConstantTimeArray):
+            # for a time-independent Hamiltonian, -iH is computed once and used
+            # directly as an array, instead of calling the time-array at every step
+            minus_iH = -1j * self.H.array
+            vector_field = lambda t, y, _: minus_iH @ y  # noqa: ARG005
+        else:
+            vector_field = lambda t, y, _: -1j * self.H(t) @ y
         return dx.ODETerm(vector_field)
 
 
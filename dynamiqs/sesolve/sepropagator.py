@@ -9,6 +9,5 @@ class SEPropagator(SEPropagatorSolver):
     # supports only ConstantTimeArray
     # TODO: support PWCTimeArray
 
-    def forward(self, delta_t: Scalar, y: Array) -> Array:
-        propagator = jax.scipy.linalg.expm(-1j * self.H * delta_t)
-        return propagator @ y
+    def propagator(self, delta_t: Scalar) -> Array:
+        return jax.scipy.linalg.expm(-1j * self.H * delta_t)
@@ -8,7 +8,7 @@ import jax
 import jax.numpy as jnp
 import jax.tree_util as jtu
 import numpy as np
-from jax import Array, lax
+from jax import Array
 from jaxtyping import ArrayLike, PyTree, ScalarLike
 
 from ._checks import check_shape, check_times
@@ -16,6 +16,9 @@ from ._utils import cdtype, obj_type_str
 
 __all__ = ['constant', 'pwc', 'modulated', 'timecallable', 'TimeArray']
 
+# types of the `ArrayLike` union, computed once instead of at every time-array addition
+_ARRAYLIKE_TYPES = get_args(ArrayLike)
+
 
 def constant(array: ArrayLike) -> ConstantTimeArray:
     r"""Instantiate a constant time-array.
@@ -54,6 +57,14 @@ def pwc(times: ArrayLike, values: ArrayLike, array: ArrayLike) -> PWCTimeArray:
         If the returned time-array is called for a time $t$ which does not belong to any
         time intervals, the returned array is null.
 
+    Note:
+        The time intervals are padded at the end with empty intervals up to a
+        power-of-two number of intervals, such that PWC time-arrays with a close
+        number of intervals share the same compiled solvers. For example, for `times`
+        of shape `(4,)` and `values` of shape `(..., 3)`, the attributes `times` and
+        `values` of the returned time-array have shape `(5,)` and `(..., 4)`, with a
+        last time interval of zero duration.
+
     Args:
         times _(array_like of shape (N+1,))_: Time points $t_k$ defining the boundaries
             of the time intervals, where _N_ is the number of time intervals.
@@ -81,6 +92,14 @@ def pwc(times: ArrayLike, values: ArrayLike, array: ArrayLike) -> PWCTimeArray:
     array = jnp.asarray(array, dtype=cdtype())
     check_shape(array, 'array', '(n, n)')
 
+    # pad with empty time intervals at the end up to the next power of two, such
+    # that PWC time-arrays with a close number of time intervals have the same shape
+    # and don't trigger a new compilation of the solvers
+    nv = values.shape[-1]
+    npad = (1 << (nv - 1).bit_length()) - nv
+    times = jnp.pad(times, (0, npad), mode='edge')
+    values = jnp.pad(values, [(0, 0)] * (values.ndim - 1) + [(0, npad)])
+
     return PWCTimeArray(times, values, array)
 
 
@@ -318,10 +337,12 @@ class ConstantTimeArray(TimeArray):
         return ConstantTimeArray(self.array * y)
 
     def __add__(self, other: ArrayLike | TimeArray) -> TimeArray:
-        if isinstance(other, get_args(ArrayLike)):
+        if isinstance(other, _ARRAYLIKE_TYPES):
             return ConstantTimeArray(jnp.asarray(other, dtype=cdtype()) + self.array)
         elif isinstance(other, ConstantTimeArray):
             return ConstantTimeArray(self.array + other.array)
+        elif isinstance(other, SummedTimeArray):
+            return other + self
         elif isinstance(other, TimeArray):
             return SummedTimeArray([self, other])
         else:
@@ -363,17 +384,7 @@ class PWCTimeArray(TimeArray):
         return PWCTimeArray(self.times, self.values.conj(), self.array.conj())
 
     def __call__(self, t: ScalarLike) -> Array:
-        def _zero(_: float) -> Array:
-            return jnp.zeros_like(self.values[..., 0])  # (...)
-
-        def _pwc(t: float) -> Array:
-            idx = jnp.searchsorted(self.times, t, side='right') - 1
-            return self.values[..., idx]  # (...)
-
-        value = lax.cond(
-            jnp.logical_or(t < self.times[0], t >= self.times[-1]), _zero, _pwc, t
-        )
-
+        value = _pwc_value(self.times, self.values, t)  # (...)
         return value.reshape(*value.shape, 1, 1) * self.array
 
     def __neg__(self) -> TimeArray:
@@ -383,15 +394,45 @@ class PWCTimeArray(TimeArray):
         return PWCTimeArray(self.times, self.values, self.array * y)
 
     def __add__(self, other: ArrayLike | TimeArray) -> TimeArray:
-        if isinstance(other, get_args(ArrayLike)):
+        if isinstance(other, _ARRAYLIKE_TYPES):
             other = ConstantTimeArray(jnp.asarray(other, dtype=cdtype()))
             return SummedTimeArray([self, other])
         elif isinstance(other, TimeArray):
-            return SummedTimeArray([self, other])
+            return SummedTimeArray([self]) + other
         else:
             return NotImplemented
 
 
+# maximum number of intervals for which the interval of a PWC time-array containing a
+# given time is found by comparing the time to all interval boundaries
+_PWC_COMPARE_ALL_MAX_NV = 128
+
+
+def _pwc_value(times: Array, values: Array, t: ScalarLike) -> Array:
+    # the value is gathered at a clipped index and masked outside of the time
+    # intervals, this is branchless and avoids a `lax.cond` (which is lowered to a
+    # `select` evaluating both branches anyway once vmapped over `t`)
+    nv = values.shape[-1]
+    # for a small number of intervals, comparing `t` to all times at once is faster
+    # than a binary search
+    method = 'compare_all' if nv <= _PWC_COMPARE_ALL_MAX_NV else 'scan'
+    idx = jnp.searchsorted(times, t, side='right', method=method) - 1
+    value = values[..., jnp.clip(idx, 0, nv - 1)]  # (...)
+    in_range = (t >= times[0]) & (t < times[-1])
+    return jnp.where(in_range, value, 0)
+
+
+def _pwc_sum(tarrays: list[PWCTimeArray], t: ScalarLike) -> Array:
+    # evaluate the sum of PWC time-arrays with the same shapes, their time intervals
+    # are looked up and their values gathered in a single vectorized operation, and
+    # the values are contracted with the arrays in a single product
+    times = jnp.stack([tarray.times for tarray in tarrays])  # (m, nv+1)
+    values = jnp.stack([tarray.values for tarray in tarrays])  # (m, ..., nv)
+    arrays = jnp.stack([tarray.array for tarray in tarrays])  # (m, n, n)
+    value = jax.vmap(_pwc_value, in_axes=(0, 0, None))(times, values, t)  # (m, ...)
+    return jnp.einsum('m...,mij->...ij', value, arrays)  # (..., n, n)
+
+
 class ModulatedTimeArray(TimeArray):
     f: BatchedCallable  # (...)
     array: Array  # (n, n)
@@ -410,18 +451,23 @@ class ModulatedTimeArray(TimeArray):
 
     @property
     def in_axes(self) -> PyTree[int]:
-        return ModulatedTimeArray(Shape(self.f.shape), Shape())
+        return ModulatedTimeArray(self.f.in_axes(self.f.shape), Shape())
 
     def reshape(self, *new_shape: int) -> TimeArray:
-        f = jtu.Partial(lambda t: self.f(t).reshape(*new_shape[:-2]))
+        # avoid wrapping `f` in a no-op transform evaluated at every call
+        if new_shape == self.shape:
+            return self
+        f = self.f.transform(jnp.reshape, static_args=(new_shape[:-2],))
         return ModulatedTimeArray(f, self.array)
 
     def broadcast_to(self, *new_shape: int) -> TimeArray:
-        f = jtu.Partial(lambda t: jnp.broadcast_to(self.f(t), *new_shape[:-2]))
+        if new_shape == self.shape:
+            return self
+        f = self.f.transform(jnp.broadcast_to, static_args=(new_shape[:-2],))
         return ModulatedTimeArray(f, self.array)
 
     def conj(self) -> TimeArray:
-        f = jtu.Partial(lambda t: self.f(t).conj())
+        f = self.f.transform(jnp.conj)
         return ModulatedTimeArray(f, self.array.conj())
 
     def __call__(self, t: ScalarLike) -> Array:
@@ -435,11 +481,11 @@ class ModulatedTimeArray(TimeArray):
         return ModulatedTimeArray(self.f, self.array * y)
 
     def __add__(self, other: ArrayLike | TimeArray) -> TimeArray:
-        if isinstance(other, get_args(ArrayLike)):
+        if isinstance(other, _ARRAYLIKE_TYPES):
             other = ConstantTimeArray(jnp.asarray(other, dtype=cdtype()))
             return SummedTimeArray([self, other])
         elif isinstance(other, TimeArray):
-            return SummedTimeArray([self, other])
+            return SummedTimeArray([self]) + other
         else:
             return NotImplemented
 
@@ -457,42 +503,47 @@ class CallableTimeArray(TimeArray):
 
     @property
     def mT(self) -> TimeArray:
-        f = jtu.Partial(lambda t: self.f(t).mT)
+        f = self.f.transform(jnp.swapaxes, static_args=(-1, -2))
         return CallableTimeArray(f)
 
     @property
     def in_axes(self) -> PyTree[int]:
-        return CallableTimeArray(Shape(self.f.shape[:-2]))
+        return CallableTimeArray(self.f.in_axes(self.f.shape[:-2]))
 
     def reshape(self, *new_shape: int) -> TimeArray:
-        f = jtu.Partial(lambda t: self.f(t).reshape(*new_shape))
+        # avoid wrapping `f` in a no-op transform evaluated at every call
+        if new_shape == self.shape:
+            return self
+        f = self.f.transform(jnp.reshape, static_args=(new_shape,))
         return CallableTimeArray(f)
 
     def broadcast_to(self, *new_shape: int) -> TimeArray:
-        f = jtu.Partial(lambda t: jnp.broadcast_to(self.f(t), new_shape))
+        if new_shape == self.shape:
+            return self
+        f = self.f.transform(jnp.broadcast_to, static_args=(new_shape,))
         return CallableTimeArray(f)
 
     def conj(self) -> TimeArray:
-        f = jtu.Partial(lambda t: self.f(t).conj())
+        f = self.f.transform(jnp.conj)
         return CallableTimeArray(f)
 
     def __call__(self, t: ScalarLike) -> Array:
         return self.f(t)
 
     def __neg__(self) -> TimeArray:
-        f = jtu.Partial(lambda t: -self.f(t))
+        f = self.f.transform(jnp.negative)
         return CallableTimeArray(f)
 
     def __mul__(self, y: ArrayLike) -> TimeArray:
-        f = jtu.Partial(lambda t: self.f(t) * y)
+        f = self.f.transform(jnp.multiply, y)
         return CallableTimeArray(f)
 
     def __add__(self, other: ArrayLike | TimeArray) -> TimeArray:
-        if isinstance(other, get_args(ArrayLike)):
+        if isinstance(other, _ARRAYLIKE_TYPES):
             other = ConstantTimeArray(jnp.asarray(other, dtype=cdtype()))
             return SummedTimeArray([self, other])
         elif isinstance(other, TimeArray):
-            return SummedTimeArray([self, other])
+            return SummedTimeArray([self]) + other
         else:
             return NotImplemented
 
@@ -530,9 +581,20 @@ class SummedTimeArray(TimeArray):
         return SummedTimeArray([tarray.conj() for tarray in self.timearrays])
 
     def __call__(self, t: ScalarLike) -> Array:
-        return jax.tree_util.tree_reduce(
-            jnp.add, [tarray(t) for tarray in self.timearrays]
-        )
+        # PWC terms with the same shapes are grouped and evaluated together
+        others, pwc_groups = [], {}
+        for tarray in self.timearrays:
+            if isinstance(tarray, PWCTimeArray):
+                key = (tarray.times.shape, tarray.values.shape, tarray.array.shape)
+                pwc_groups.setdefault(key, []).append(tarray)
+            else:
+                others.append(tarray)
+
+        values = [tarray(t) for tarray in others]
+        for group in pwc_groups.values():
+            values.append(group[0](t) if len(group) == 1 else _pwc_sum(group, t))
+
+        return jax.tree_util.tree_reduce(jnp.add, values)
 
     def __neg__(self) -> TimeArray:
         return SummedTimeArray([-tarray for tarray in self.timearrays])
@@ -541,14 +603,61 @@ class SummedTimeArray(TimeArray):
         return SummedTimeArray([tarray * y for tarray in self.timearrays])
 
     def __add__(self, other: ArrayLike | TimeArray) -> TimeArray:
-        if isinstance(other, get_args(ArrayLike)):
+        if isinstance(other, _ARRAYLIKE_TYPES):
             other = ConstantTimeArray(jnp.asarray(other, dtype=cdtype()))
-            return SummedTimeArray([*self.timearrays, other])
+
+        if isinstance(other, ConstantTimeArray):
+            # constant terms are folded together when the sum is built, so that a
+            # single constant term is added when the sum is evaluated
+            return self._fold(
+                other, lambda x: isinstance(x, ConstantTimeArray), lambda x: x + other
+            )
+        elif isinstance(other, ModulatedTimeArray):
+            # modulated terms with the same function are folded together by summing
+            # their arrays, so that the function is evaluated once for all of them
+            return self._fold(
+                other,
+                lambda x: (
+                    isinstance(x, ModulatedTimeArray) and _same_callable(x.f, other.f)
+                ),
+                lambda x: ModulatedTimeArray(x.f, x.array + other.array),
+            )
+        elif isinstance(other, SummedTimeArray):
+            # the terms of the other sum are appended one by one, instead of nesting
+            # the sums
+            result = self
+            for tarray in other.timearrays:
+                result = result + tarray
+            return result
         elif isinstance(other, TimeArray):
             return SummedTimeArray([*self.timearrays, other])
         else:
             return NotImplemented
 
+    def _fold(
+        self,
+        other: TimeArray,
+        can_fold: callable[[TimeArray], bool],
+        fold: callable[[TimeArray], TimeArray],
+    ) -> TimeArray:
+        # replace the first term `x` such that `can_fold(x)` by `fold(x)`, or append
+        # `other` to the sum if there is no such term
+        for i, tarray in enumerate(self.timearrays):
+            if can_fold(tarray):
+                timearrays = list(self.timearrays)
+                timearrays[i] = fold(tarray)
+                return SummedTimeArray(timearrays)
+        return SummedTimeArray([*self.timearrays, other])
+
+
+def _same_callable(f: BatchedCallable, g: BatchedCallable) -> bool:
+    # two batched callables evaluate to the same values if they wrap the same function
+    # with the same leaves, the leaves are compared by identity because they may be
+    # traced
+    f_leaves, f_treedef = jtu.tree_flatten(f.f)
+    g_leaves, g_treedef = jtu.tree_flatten(g.f)
+    return f_treedef == g_treedef and all(x is y for x, y in zip(f_leaves, g_leaves))
+
 
 class BatchedCallable(eqx.Module):
     # this class turns a callable into a PyTree that is vmap-compatible
@@ -557,18 +666,49 @@ class BatchedCallable(eqx.Module):
     indices: list[Array]
 
     def __init__(self, f: callable[[float], Array]):
-        # make f a valid PyTree with `Partial`
-        self.f = jtu.Partial(f)
-        shape = jax.eval_shape(f, 0.0).shape
-        self.indices = list(jnp.indices(shape))
+        # make f a valid PyTree with `Partial` (if it is not already a PyTree)
+        self.f = f if isinstance(f, eqx.Module) else jtu.Partial(f)
+        self.indices = list(jnp.indices(self._eval_shape().shape))
 
     def __call__(self, t: ScalarLike) -> Array:
         return self.f(t)[tuple(self.indices)]
 
+    def in_axes(self, batch_shape: tuple[int, ...]) -> PyTree[int]:
+        # only the indices are vmapped, the leaves of `f` are shared by all batch
+        # elements
+        return eqx.tree_at(lambda x: (x.f, x.indices), self, (None, Shape(batch_shape)))
+
+    def transform(
+        self, fn: callable, *args: ArrayLike, static_args: tuple = ()
+    ) -> BatchedCallable:
+        # returns a new batched callable `t -> fn(self(t), *static_args, *args)`
+        return BatchedCallable(_TransformedCallable(self, fn, static_args, args))
+
+    def _eval_shape(self) -> jax.ShapeDtypeStruct:
+        # `self.f` is passed as an argument rather than as the evaluated function,
+        # because `jax.eval_shape` hashes the function and `self.f` may hold traced
+        # leaves
+        return jax.eval_shape(lambda f: f(0.0), self.f)
+
     @property
     def dtype(self) -> tuple[int, ...]:
-        return jax.eval_shape(self.f, 0.0).dtype
+        return self._eval_shape().dtype
 
     @property
     def shape(self) -> tuple[int, ...]:
-        return jax.eval_shape(self.f, 0.0).shape
+        return self._eval_shape().shape
+
+
+class _TransformedCallable(eqx.Module):
+    # Applies a function to the output of a batched callable. The function and its
+    # static arguments are stored in the PyTree structure instead of being captured
+    # in a closure, so that two identical transformations have the same treedef and
+    # hit the `jax.jit` compilation cache. The dynamic arguments are PyTree leaves.
+
+    f: BatchedCallable
+    fn: callable = eqx.field(static=True)
+    static_args: tuple = eqx.field(static=True)
+    args: tuple[ArrayLike, ...]
+
+    def __call__(self, t: ScalarLike) -> Array:
+        return self.fn(self.f(t), *self.static_args, *self.args)
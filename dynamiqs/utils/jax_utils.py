@@ -147,6 +147,14 @@ def set_matmul_precision(matmul_precision: Literal['low', 'high', 'highest']):
     - `'highest'` keeps matmul precision to `float32` or `float64` as applicable
         (slowest but most accurate, default setting).
 
+    Note:
+        Only the internal computation of the matmul is affected: operators and states
+        are still stored, and matmul results returned, in the default floating point
+        precision (see [`dq.set_precision()`][dynamiqs.set_precision]). For large
+        systems, the solvers spend most of their time in matmuls, so using `'high'`
+        or `'low'` can significantly speed up e.g.
+        [`dq.mesolve()`][dynamiqs.mesolve] on GPUs and TPUs.
+
     Note-: Equivalent JAX syntax
         This function is equivalent to setting `jax_default_matmul_precision` in
         `jax.config`. See [JAX documentation on matmul precision](https://jax.readthedocs.io/en/latest/_autosummary/jax.default_matmul_precision.html)
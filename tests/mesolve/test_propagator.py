@@ -1,13 +1,23 @@
+import jax.numpy as jnp
+import numpy as np
+
 from dynamiqs.gradient import Autograd
 from dynamiqs.solver import Propagator
 
 from ..solver_tester import SolverTester
-from .open_system import ocavity
+from .open_system import OCavity, ocavity
 
 
 class TestMEPropagator(SolverTester):
     def test_correctness(self):
         self._test_correctness(ocavity, Propagator())
 
+    def test_correctness_nonuniform_tsave(self):
+        # the propagator is recomputed at each step for non equally spaced save times
+        tsave = np.array([0.0, 0.05, 0.07, 0.2, 0.3])
+        Hz = 2 * jnp.pi
+        system = OCavity(n=8, delta=Hz, alpha0=0.5, kappa=Hz, tsave=tsave)
+        self._test_correctness(system, Propagator())
+
     def test_gradient(self):
         self._test_gradient(ocavity, Propagator(), Autograd())
@@ -92,6 +92,8 @@ def test_timearray_batching():
     assert result.states.shape == (5, 11, 4, 1)
     result = dq.sesolve(H0 + H_cal, psi0, times)
     assert result.states.shape == (5, 11, 4, 1)
+    result = dq.sesolve(2 * H_cal.conj(), psi0, times)
+    assert result.states.shape == (5, 11, 4, 1)
 
 
 def test_sum_batching():
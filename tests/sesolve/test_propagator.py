@@ -1,13 +1,22 @@
+import jax.numpy as jnp
+import numpy as np
+
 from dynamiqs.gradient import Autograd
 from dynamiqs.solver import Propagator
 
 from ..solver_tester import SolverTester
-from .closed_system import cavity
+from .closed_system import Cavity, cavity
 
 
 class TestSEPropagator(SolverTester):
     def test_correctness(self):
         self._test_correctness(cavity, Propagator())
 
+    def test_correctness_nonuniform_tsave(self):
+        # the propagator is recomputed at each step for non equally spaced save times
+        tsave = np.array([0.0, 0.05, 0.07, 0.2, 0.3])
+        system = Cavity(n=8, delta=2 * jnp.pi, alpha0=0.5, tsave=tsave)
+        self._test_correctness(system, Propagator())
+
     def test_gradient(self):
         self._test_gradient(cavity, Propagator(), Autograd())
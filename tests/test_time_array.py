@@ -6,6 +6,7 @@ import pytest
 
 from dynamiqs.time_array import (
     ConstantTimeArray,
+    PWCTimeArray,
     SummedTimeArray,
     modulated,
     pwc,
@@ -97,11 +98,16 @@ class TestCallableTimeArray:
 
     def test_reshape(self):
         x = self.x.reshape(1, 2)
+        assert x.shape == (1, 2)
         assert_equal(x(0.0), [[0, 0]])
         assert_equal(x(1.0), [[1, 2]])
 
+        # reshaping to the same shape returns the time-array itself
+        assert self.x.reshape(*self.x.shape) is self.x
+
     def test_broadcast(self):
         x = self.x.broadcast_to(2, 2)
+        assert x.shape == (2, 2)
         assert_equal(x(0.0), [[0, 0], [0, 0]])
         assert_equal(x(1.0), [[1, 2], [1, 2]])
 
@@ -121,6 +127,13 @@ class TestCallableTimeArray:
         assert_equal(x(0.0), [0, 0])
         assert_equal(x(1.0), [2, 4])
 
+    def test_jit_cache(self):
+        # equal transformations of the same function should not trigger a new trace
+        f = jax.jit(lambda x, t: x(t))
+        f(2 * self.x, 0.0)
+        f(2 * self.x, 1.0)
+        assert f._cache_size() == 1  # noqa: SLF001
+
     def test_rmul(self):
         x = 2 * self.x
         assert_equal(x(0.0), [0, 0])
@@ -191,6 +204,17 @@ class TestPWCTimeArray:
         assert_equal(self.x(3.0), [[1j, 1j], [1j, 1j]])
         assert_equal(self.x(5.0), [[0, 0], [0, 0]])
 
+    def test_padding(self):
+        # PWC time-arrays with a close number of time intervals share the same
+        # compiled function
+        f = jax.jit(lambda x, t: x(t))
+        f(self.x, 0.0)
+        f(pwc(jnp.arange(5), jnp.ones(4), jnp.eye(2)), 0.0)
+        assert f._cache_size() == 1  # noqa: SLF001
+
+        assert jnp.array_equal(self.x(2.5), jnp.array([[100, 200], [300, 400]]))
+        assert jnp.array_equal(self.x(3.0), jnp.array([[0, 0], [0, 0]]))
+
     def test_reshape(self):
         x = self.x.reshape(1, 2, 2)
         assert_equal(x(-0.1), [[[0, 0], [0, 0]]])
@@ -267,6 +291,9 @@ class TestModulatedTimeArray:
         assert_equal(x(0.0), [[[1.0j, 2.0j], [3.0j, 4.0j]]])
         assert_equal(x(2.0), [[[1.0 + 5.0j, 2.0 + 6.0j], [3.0 + 7.0j, 4.0 + 8.0j]]])
 
+        # reshaping to the same shape returns the time-array itself
+        assert self.x.reshape(2, 2) is self.x
+
     def test_broadcast(self):
         x = self.x.broadcast_to(2, 2, 2)
         assert_equal(
@@ -326,3 +353,70 @@ class TestModulatedTimeArray:
         assert isinstance(x, SummedTimeArray)
         assert_equal(x(-0.1), [[1, 1], [1, 1]])
         assert_equal(x(0.0), [[2, 3], [4, 5]])
+
+
+class TestSummedTimeArray:
+    @pytest.fixture(autouse=True)
+    def _setup(self):
+        times = jnp.array([0, 1, 2])
+        values = jnp.array([1, 10])
+        array = jnp.array([[1, 2], [3, 4]])
+
+        self.x = pwc(times, values, array) + 1  # shape at t: (2, 2)
+
+    def test_call(self):
+        assert jnp.array_equal(self.x(-0.1), jnp.array([[1, 1], [1, 1]]))
+        assert jnp.array_equal(self.x(0.0), jnp.array([[2, 3], [4, 5]]))
+        assert jnp.array_equal(self.x(1.0), jnp.array([[11, 21], [31, 41]]))
+
+    def test_add_constant(self):
+        # constant terms are folded together
+        x = self.x + 2
+        assert isinstance(x, SummedTimeArray)
+        assert len(x.timearrays) == 2
+        assert jnp.array_equal(x(0.0), jnp.array([[4, 5], [6, 7]]))
+
+        x = ConstantTimeArray(jnp.array([[1, 1], [1, 1]])) + self.x
+        assert len(x.timearrays) == 2
+        assert jnp.array_equal(x(0.0), jnp.array([[3, 4], [5, 6]]))
+
+    def test_add_timearray(self):
+        x = self.x + self.x.timearrays[0]
+        assert isinstance(x, SummedTimeArray)
+        assert isinstance(x.timearrays[-1], PWCTimeArray)
+        assert jnp.array_equal(x(0.0), jnp.array([[3, 5], [7, 9]]))
+
+    def test_call_pwc_group(self):
+        # PWC terms with the same shapes are evaluated together
+        times = jnp.array([0, 1, 2])
+        y1 = pwc(times, jnp.array([1, 10]), jnp.array([[1, 0], [0, 0]]))
+        y2 = pwc(times + 1, jnp.array([2, 20]), jnp.array([[0, 1], [0, 0]]))
+        x = self.x + y1 + y2
+        assert jnp.array_equal(x(0.0), jnp.array([[3, 3], [4, 5]]))
+        assert jnp.array_equal(x(1.0), jnp.array([[21, 23], [31, 41]]))
+        assert jnp.array_equal(x(2.0), jnp.array([[1, 21], [1, 1]]))
+
+    def test_add_summed(self):
+        # sums are flattened instead of nested
+        x = self.x + self.x
+        assert isinstance(x, SummedTimeArray)
+        assert len(x.timearrays) == 3  # pwc + (constant + constant) + pwc
+        assert jnp.array_equal(x(0.0), jnp.array([[4, 6], [8, 10]]))
+
+        x = self.x.timearrays[0] + self.x
+        assert len(x.timearrays) == 3
+        assert all(not isinstance(y, SummedTimeArray) for y in x.timearrays)
+        assert jnp.array_equal(x(0.0), jnp.array([[3, 5], [7, 9]]))
+
+    def test_add_modulated(self):
+        # modulated terms with the same function are folded together
+        eps = lambda t: (0.5 * t + 1.0j) * jnp.array(1.0)
+        y = modulated(eps, jnp.array([[1, 2], [3, 4]]))
+        x = self.x + y + 2 * y
+        assert len(x.timearrays) == 3  # pwc + constant + modulated
+        expected = jnp.array([[2 + 3.0j, 3 + 6.0j], [4 + 9.0j, 5 + 12.0j]])
+        assert jnp.allclose(x(0.0), expected)
+
+        # modulated terms with different functions are kept separate
+        x = self.x + y + modulated(lambda t: 2 * eps(t), jnp.array([[1, 2], [3, 4]]))
+        assert len(x.timearrays) == 4
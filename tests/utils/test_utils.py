@@ -1,10 +1,11 @@
 import jax
 import jax.numpy as jnp
+import numpy as np
 import pytest
 import qutip as qt
 
 import dynamiqs as dq
-from dynamiqs._utils import cdtype
+from dynamiqs._utils import asjaxarray, cdtype
 
 
 def test_ket_fidelity_correctness():
@@ -142,3 +143,22 @@ def test_jit_ptrace():
     ap = dq.ptrace(ab, 0, (20, 30))
 
     assert jnp.allclose(a, ap, 1e-3)
+
+
+def test_asjaxarray():
+    # list of QuTiP objects
+    x = asjaxarray([qt.basis(3, 0), qt.basis(3, 1)], dtype=cdtype())
+    assert x.shape == (2, 3, 1)
+    assert x.dtype == cdtype()
+    assert jnp.array_equal(x, jnp.stack([dq.basis(3, 0), dq.basis(3, 1)]))
+
+    # list of NumPy arrays
+    x = asjaxarray([np.eye(2), np.zeros((2, 2))], dtype=cdtype())
+    assert x.shape == (2, 2, 2)
+    assert x.dtype == cdtype()
+    assert jnp.array_equal(x, jnp.stack([jnp.eye(2), jnp.zeros((2, 2))]))
+
+    # empty list
+    x = asjaxarray([], dtype=cdtype())
+    assert x.shape == (0,)
+    assert x.dtype == cdtype()